@@ -1,49 +1,89 @@
+import argparse
 import csv
 import json
 import sys
 
-def convert_csv_to_json(csv_filepath, json_filepath):
+# Optional accelerator: orjson serializes several times faster than the
+# stdlib encoder. Falls back to compact json.dumps when not installed.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+if orjson is not None:
+    _dumps = orjson.dumps
+else:
+    def _dumps(obj):
+        return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+# Large write buffer so streaming rows does not degrade into tiny writes
+WRITE_BUFFER_SIZE = 1 << 20
+
+def convert_csv_to_json(csv_filepath, json_filepath, ndjson=False):
     """
-    Converts a CSV file to a JSON file.
-    Each row in the CSV becomes an object in a JSON array.
+    Converts a CSV file to a JSON file, streaming one row at a time.
+    By default the output is a JSON array with one object per CSV row;
+    with ndjson=True each row becomes one JSON object per line.
+    Memory use stays constant regardless of file size.
     """
     # Check if the file paths are valid
     if not csv_filepath or not json_filepath:
         print("Error: Missing file paths. Please provide both input CSV and output JSON file names.")
         return
 
-    data = []
-    
-    # Read the CSV file
+    # The two opens are handled separately so a failure blames the right
+    # file: a missing input is not the same error as an unwritable output.
     try:
-        with open(csv_filepath, 'r', encoding='utf-8') as csvfile:
-            csv_reader = csv.DictReader(csvfile)
-            for row in csv_reader:
-                data.append(row)
+        csvfile = open(csv_filepath, 'r', encoding='utf-8', newline='')
     except FileNotFoundError:
         print(f"Error: The file '{csv_filepath}' was not found.")
         return
-    except Exception as e:
+    except OSError as e:
         print(f"An error occurred while reading the CSV file: {e}")
         return
 
-    # Write the data to a JSON file
-    try:
-        with open(json_filepath, 'w', encoding='utf-8') as jsonfile:
-            json.dump(data, jsonfile, indent=4)
-        print(f"Conversion successful! Data from '{csv_filepath}' saved to '{json_filepath}'.")
-    except Exception as e:
-        print(f"An error occurred while writing the JSON file: {e}")
+    with csvfile:
+        try:
+            jsonfile = open(json_filepath, 'wb', buffering=WRITE_BUFFER_SIZE)
+        except OSError as e:
+            print(f"An error occurred while writing the JSON file: {e}")
+            return
+
+        try:
+            with jsonfile:
+                csv_reader = csv.reader(csvfile)
+                header = next(csv_reader, None)
+                if header is None:
+                    print(f"Error: The file '{csv_filepath}' has no header row.")
+                    return
+
+                count = 0
+                if ndjson:
+                    for row in csv_reader:
+                        jsonfile.write(_dumps(dict(zip(header, row))))
+                        jsonfile.write(b"\n")
+                        count += 1
+                else:
+                    jsonfile.write(b"[")
+                    for row in csv_reader:
+                        if count:
+                            jsonfile.write(b",\n")
+                        jsonfile.write(_dumps(dict(zip(header, row))))
+                        count += 1
+                    jsonfile.write(b"]")
+        except Exception as e:
+            print(f"An error occurred during conversion: {e}")
+            return
+    print(f"Conversion successful! {count} rows from '{csv_filepath}' saved to '{json_filepath}'.")
+
+def parse_args():
+    p = argparse.ArgumentParser(description="Convert a CSV file to JSON, streaming row by row.")
+    p.add_argument("input_csv", help="Input CSV path")
+    p.add_argument("output_json", help="Output JSON path")
+    p.add_argument("--ndjson", action="store_true",
+                   help="Write one JSON object per line (NDJSON) instead of a JSON array.")
+    return p.parse_args()
 
 if __name__ == "__main__":
-    # Check if the correct number of arguments are provided
-    if len(sys.argv) != 3:
-        print("Usage: python your_script_name.py <input.csv> <output.json>")
-    else:
-        # sys.argv[0] is the script name itself
-        # sys.argv[1] is the first argument (input file)
-        # sys.argv[2] is the second argument (output file)
-        input_csv = sys.argv[1]
-        output_json = sys.argv[2]
-        
-        convert_csv_to_json(input_csv, output_json)
+    args = parse_args()
+    convert_csv_to_json(args.input_csv, args.output_json, ndjson=args.ndjson)
@@ -28,6 +28,8 @@ import argparse
 import csv
 from dataclasses import dataclass
 from datetime import date, timedelta
+import mmap
+import os
 from pathlib import Path
 import random
 import sys
@@ -38,6 +40,24 @@ try:
 except ImportError:
     sys.exit("Missing dependency: faker. Install with `pip install faker` and retry.")
 
+from mockgen._fake import get_faker
+
+# Optional accelerator: pyarrow tokenizes CSV in C++ with multi-threaded
+# readers. The stdlib csv module is used when it is not installed.
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+except ImportError:
+    pa = None
+    pacsv = None
+
+# Optional accelerator: numpy draws whole date/time columns in one call
+# instead of one random call per event.
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 DEFAULT_EVENTS_OUT = "mock_events.csv"
 DEFAULT_JOIN_OUT = "mock_events-teams.csv"
 DEFAULT_TEAMS_CSV = "mock_teams.csv"
@@ -55,9 +75,18 @@ class Args:
     seed: int | None
     locale: str
 
-def parse_args() -> Args:
+def existing_csv(s: str) -> Path:
+    # Validating in the argparse type callback fails fast, before Faker init
+    p = Path(s)
+    if not p.is_file():
+        raise argparse.ArgumentTypeError(f"{s} not found")
+    return p
+
+def parse_args(argv: List[str] | None = None) -> Args:
     p = argparse.ArgumentParser(description="Generate mock events and event-team join rows.")
-    p.add_argument("--teams-csv", type=Path, default=Path(DEFAULT_TEAMS_CSV))
+    # String default so argparse runs the type callback on it too.
+    # --venues-csv stays a plain Path: a missing venues file is allowed.
+    p.add_argument("--teams-csv", type=existing_csv, default=DEFAULT_TEAMS_CSV)
     p.add_argument("--venues-csv", type=Path, default=Path(DEFAULT_VENUES_CSV))
     p.add_argument("--events-out", type=Path, default=Path(DEFAULT_EVENTS_OUT))
     p.add_argument("--join-out", type=Path, default=Path(DEFAULT_JOIN_OUT))
@@ -66,7 +95,7 @@ def parse_args() -> Args:
     p.add_argument("--teams-per-event", type=int)
     p.add_argument("--seed", type=int, default=None)
     p.add_argument("--locale", type=str, default="en_US")
-    ns = p.parse_args()
+    ns = p.parse_args(argv)
     return Args(
         teams_csv=ns.teams_csv,
         venues_csv=ns.venues_csv,
@@ -92,21 +121,84 @@ def prompt_int(question: str, default_value: int) -> int:
         print(f"Invalid integer. Using default {default_value}.")
         return default_value
 
+def _read_column_mmap(path: Path, col: str) -> List[str] | None:
+    """Extract one column from a memory-mapped CSV without the csv module.
+
+    Valid because the sister scripts never quote these columns; returns
+    None when the file is empty or contains quoted fields.
+    """
+    with path.open("rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return None
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            if mm.find(b'"') != -1:
+                return None
+            header_end = mm.find(b"\n")
+            if header_end == -1:
+                return None
+            headers = [h.strip() for h in
+                       mm[:header_end].decode("utf-8").rstrip("\r").split(",")]
+            if col not in headers:
+                sys.exit(f"Required column '{col}' not found in {path}. Headers: {headers}")
+            idx = headers.index(col)
+            ids: List[str] = []
+            append = ids.append
+            # Walk newline offsets instead of slicing the whole map, which
+            # would copy the file into memory a second time.
+            size = mm.size()
+            pos = header_end + 1
+            while pos < size:
+                nl = mm.find(b"\n", pos)
+                if nl == -1:
+                    nl = size
+                fields = mm[pos:nl].rstrip(b"\r").split(b",")
+                pos = nl + 1
+                if idx < len(fields):
+                    v = fields[idx].strip()
+                    if v:
+                        append(v.decode("utf-8"))
+            return ids
+        finally:
+            mm.close()
+
 def read_ids_from_csv(path: Path, col: str) -> List[str]:
-    if not path.exists():
-        sys.exit(f"Required CSV not found: {path}")
+    if pacsv is not None:
+        try:
+            table = pacsv.read_csv(path, convert_options=pacsv.ConvertOptions(
+                include_columns=[col], column_types={col: pa.string()}))
+        except (KeyError, pa.ArrowInvalid):
+            # No exact match for the header, or an empty file. The stdlib
+            # paths strip header whitespace before matching and report
+            # a genuinely missing column, so fall through to them.
+            table = None
+        if table is not None:
+            ids = [v.strip() for v in table.column(col).to_pylist() if v and v.strip()]
+            if not ids:
+                sys.exit(f"No '{col}' values found in {path}.")
+            return ids
+    ids = _read_column_mmap(path, col)
+    if ids is not None:
+        if not ids:
+            sys.exit(f"No '{col}' values found in {path}.")
+        return ids
+    # Known fixed schema from the sister scripts: resolve the column index
+    # once and read tuple rows, skipping DictReader's per-row dict build.
     with path.open("r", encoding="utf-8", newline="") as f:
-        reader = csv.DictReader(f)
-        if reader.fieldnames is None:
+        reader = csv.reader(f)
+        header = next(reader, None)
+        if header is None:
             sys.exit(f"{path} has no header row.")
-        headers = [h.strip() for h in reader.fieldnames]
+        headers = [h.strip() for h in header]
         if col not in headers:
             sys.exit(f"Required column '{col}' not found in {path}. Headers: {headers}")
+        idx = headers.index(col)
         ids: List[str] = []
         for row in reader:
-            v = str(row.get(col, "")).strip()
-            if v:
-                ids.append(v)
+            if idx < len(row):
+                v = row[idx].strip()
+                if v:
+                    ids.append(v)
         if not ids:
             sys.exit(f"No '{col}' values found in {path}.")
         return ids
@@ -115,16 +207,20 @@ def read_ids_optional(path: Path, col: str) -> List[str]:
     if not path.exists():
         return []
     with path.open("r", encoding="utf-8", newline="") as f:
-        reader = csv.DictReader(f)
-        if not reader.fieldnames or col not in reader.fieldnames:
+        reader = csv.reader(f)
+        header = next(reader, None)
+        if not header or col not in header:
             return []
-        return [str(row.get(col, "")).strip() for row in reader if str(row.get(col, "")).strip()]
+        idx = header.index(col)
+        return [row[idx].strip() for row in reader if idx < len(row) and row[idx].strip()]
+
+# Module-level pool so pick_event_name and the bulk path share one list
+EVENT_NAME_SUFFIXES = [
+    "Challenge","Classic","Championship","Cup","Derby","Finals","Invitational","Invite","Open","Series","Showcase"
+]
 
 def pick_event_name(fake: Faker, rng: random.Random) -> str:
-    suffix = rng.choice([
-        "Challenge","Classic","Championship","Cup","Derby","Finals","Invitational","Invite","Open","Series","Showcase"
-    ])
-    return f"{fake.city()} {suffix}"
+    return f"{fake.city()} {rng.choice(EVENT_NAME_SUFFIXES)}"
 
 def pick_event_date(rng: random.Random) -> str:
     start = date.today()
@@ -143,32 +239,88 @@ def generate(events_count: int, teams_per_event: int, team_ids: List[str], venue
     if teams_per_event > len(team_ids):
         sys.exit(f"teams_per_event ({teams_per_event}) exceeds available teams ({len(team_ids)}).")
 
-    events_rows: List[dict] = []
-    join_rows: List[dict] = []
+    # Column buffers (SoA): one list per output column instead of a
+    # container per row.
+    event_ids: List[int] = []
+    event_names: List[str] = []
+    event_dates: List[str] = []
+    event_venue_ids: List[str] = []
+    event_start_times: List[str] = []
+    join_event_ids: List[int] = []
+    join_team_ids: List[str] = []
+
+    if np is not None:
+        # Vectorized draws on PCG64: one numpy call per column, seeded from
+        # the shared rng so --seed stays reproducible (and from os.urandom
+        # via random.Random when unseeded). PCG64 is also faster per draw
+        # than the stdlib Mersenne Twister.
+        np_rng = np.random.default_rng(rng.getrandbits(64))
+        day_offsets = np_rng.integers(0, 181, size=events_count)
+        dates = (np.datetime64(date.today()) + day_offsets.astype("timedelta64[D]"))\
+            .astype(str).tolist()
+        hours = np_rng.integers(8, 21, size=events_count).tolist()
+        minutes = np_rng.choice([0, 15, 30, 45], size=events_count).tolist()
+        times = [f"{h:02d}:{m:02d}" for h, m in zip(hours, minutes)]
+        venues = (np_rng.choice(np.asarray(venue_ids, dtype=object), size=events_count).tolist()
+                  if venue_ids else [""] * events_count)
+        suffixes = np_rng.choice(
+            np.asarray(EVENT_NAME_SUFFIXES, dtype=object), size=events_count).tolist()
+    else:
+        dates = [pick_event_date(rng) for _ in range(events_count)]
+        times = [pick_start_time(rng) for _ in range(events_count)]
+        venues = [rng.choice(venue_ids) if venue_ids else "" for _ in range(events_count)]
+        suffixes = rng.choices(EVENT_NAME_SUFFIXES, k=events_count)
+
+    # Bulk the Faker city draws out of the hot loop and join names once
+    city = fake.city
+    names = [f"{city()} {suffix}" for suffix in suffixes]
 
     for i in range(events_count):
         eid = start_event_id + i
-        events_rows.append({
-            "event_id": eid,
-            "event_name": pick_event_name(fake, rng),
-            "event_date": pick_event_date(rng),
-            "event_venue_id": (rng.choice(venue_ids) if venue_ids else ""),
-            "event_start_time": pick_start_time(rng),
-        })
-        for tid in rng.sample(team_ids, k=teams_per_event):
-            join_rows.append({"event_id": eid, "team_id": tid})
-    return events_rows, join_rows
-
-def write_csv(path: Path, rows: List[dict], fieldnames: List[str]) -> None:
+        event_ids.append(eid)
+        event_names.append(names[i])
+        event_dates.append(dates[i])
+        event_venue_ids.append(venues[i])
+        event_start_times.append(times[i])
+
+    if np is not None:
+        # Batched sampling: argpartition of one random matrix picks
+        # teams_per_event distinct teams per event in a single C-level
+        # partial sort instead of events_count rng.sample loops.
+        m = np_rng.random((events_count, len(team_ids)))
+        idx = np.argpartition(m, teams_per_event - 1, axis=1)[:, :teams_per_event]
+        join_event_ids = np.repeat(np.asarray(event_ids), teams_per_event).tolist()
+        join_team_ids = np.asarray(team_ids, dtype=object)[idx].ravel().tolist()
+    else:
+        for eid in event_ids:
+            for tid in rng.sample(team_ids, k=teams_per_event):
+                join_event_ids.append(eid)
+                join_team_ids.append(tid)
+
+    events_cols = {
+        "event_id": event_ids,
+        "event_name": event_names,
+        "event_date": event_dates,
+        "event_venue_id": event_venue_ids,
+        "event_start_time": event_start_times,
+    }
+    join_cols = {"event_id": join_event_ids, "team_id": join_team_ids}
+    return events_cols, join_cols
+
+def write_csv(path: Path, columns: dict) -> None:
+    """Write a dict of equal-length column lists, keyed by fieldname."""
     path.parent.mkdir(parents=True, exist_ok=True)
+    if pacsv is not None and any(columns.values()):
+        pacsv.write_csv(pa.table(columns), str(path))
+        return
     with path.open("w", encoding="utf-8", newline="") as f:
-        w = csv.DictWriter(f, fieldnames=fieldnames)
-        w.writeheader()
-        w.writerows(rows)
+        w = csv.writer(f)
+        w.writerow(list(columns))
+        w.writerows(zip(*columns.values()))
 
-def main() -> int:
-    args = parse_args()
-    fake = Faker(args.locale)
+def main(argv: List[str] | None = None) -> int:
+    args = parse_args(argv)
+    fake = get_faker(args.locale, args.seed)
     rng = random.Random(args.seed)
 
     events_count = args.num_events if args.num_events is not None else prompt_int("How many events to generate?", 20)
@@ -177,14 +329,14 @@ def main() -> int:
     team_ids = read_ids_from_csv(args.teams_csv, "team_id")
     venue_ids = read_ids_optional(args.venues_csv, "venue_id")
 
-    events_rows, join_rows = generate(events_count, teams_per_event, team_ids, venue_ids,
+    events_cols, join_cols = generate(events_count, teams_per_event, team_ids, venue_ids,
                                       args.start_event_id, fake, rng)
 
-    write_csv(args.events_out, events_rows, ["event_id","event_name","event_date","event_venue_id","event_start_time"])
-    write_csv(args.join_out, join_rows, ["event_id","team_id"])
+    write_csv(args.events_out, events_cols)
+    write_csv(args.join_out, join_cols)
 
-    print(f"Wrote {len(events_rows)} events to {args.events_out}")
-    print(f"Wrote {len(join_rows)} event-team rows to {args.join_out}")
+    print(f"Wrote {len(events_cols['event_id'])} events to {args.events_out}")
+    print(f"Wrote {len(join_cols['event_id'])} event-team rows to {args.join_out}")
     return 0
 
 if __name__ == "__main__":
@@ -26,10 +26,13 @@ from __future__ import annotations
 
 import argparse
 import csv
+import mmap
+import multiprocessing
+import os
 import random
 import sys
 from pathlib import Path
-from typing import List, Tuple
+from typing import List
 
 try:
     from faker import Faker
@@ -37,20 +40,126 @@ except Exception as e:
     print("Faker is required. Install with: pip install faker", file=sys.stderr)
     raise
 
+from mockgen._fake import get_faker
+
+# Optional accelerator: pyarrow tokenizes CSV in C++ with multi-threaded
+# readers. The stdlib csv module is used when it is not installed.
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+except ImportError:
+    pa = None
+    pacsv = None
+
+# Optional accelerator: numpy draws whole numeric columns in one call
+# instead of one random.randint per player.
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+def existing_csv(s: str) -> Path:
+    # Validating in the argparse type callback fails fast, before Faker init
+    p = Path(s)
+    if not p.is_file():
+        raise argparse.ArgumentTypeError(f"{s} not found")
+    return p
+
+
+def _read_team_ids_mmap(teams_csv: Path) -> List[int] | None:
+    """Extract team_id ints from a memory-mapped CSV without the csv module.
+
+    Valid because the teams script never quotes this column; returns None
+    when the file is empty or contains quoted fields.
+    """
+    with teams_csv.open("rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return None
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            if mm.find(b'"') != -1:
+                return None
+            header_end = mm.find(b"\n")
+            if header_end == -1:
+                return None
+            headers = [h.strip().lower() for h in
+                       mm[:header_end].decode("utf-8").rstrip("\r").split(",")]
+            if "team_id" not in headers:
+                raise KeyError("Expected 'team_id' column in teams CSV.")
+            idx = headers.index("team_id")
+            team_ids: List[int] = []
+            append = team_ids.append
+            # Walk newline offsets instead of slicing the whole map, which
+            # would copy the file into memory a second time.
+            size = mm.size()
+            pos = header_end + 1
+            while pos < size:
+                nl = mm.find(b"\n", pos)
+                if nl == -1:
+                    nl = size
+                fields = mm[pos:nl].rstrip(b"\r").split(b",")
+                pos = nl + 1
+                if idx < len(fields):
+                    v = fields[idx].strip()
+                    if v:
+                        try:
+                            append(int(v))
+                        except ValueError:
+                            raise ValueError(f"Invalid team_id value: {v.decode('utf-8')!r}")
+            return team_ids
+        finally:
+            mm.close()
+
+
+def _resolve_team_id_header(teams_csv: Path) -> str | None:
+    """Find the actual spelling of the team_id header, case-insensitively.
+
+    Arrow's include_columns is an exact match, so the common header
+    variants the fallback readers accept have to be resolved first.
+    """
+    with teams_csv.open("rb") as f:
+        first = f.readline()
+    for h in first.decode("utf-8", "replace").rstrip("\r\n").split(","):
+        if h.strip().lower() == "team_id":
+            return h.strip()
+    return None
+
 
 def read_team_ids(teams_csv: Path) -> List[int]:
-    if not teams_csv.exists():
-        raise FileNotFoundError(f"Teams CSV not found: {teams_csv}")
+    if pacsv is not None:
+        col = _resolve_team_id_header(teams_csv)
+        if col is not None:
+            try:
+                table = pacsv.read_csv(teams_csv, convert_options=pacsv.ConvertOptions(
+                    include_columns=[col], column_types={col: pa.int64()}))
+            except (KeyError, pa.ArrowInvalid):
+                # Empty or unparsable file, or a bad team_id value: fall
+                # through so the stdlib paths report it the usual way.
+                table = None
+            if table is not None:
+                team_ids = [v for v in table.column(col).to_pylist() if v is not None]
+                if not team_ids:
+                    raise ValueError("No team_id values found in teams CSV.")
+                return team_ids
+    mmap_ids = _read_team_ids_mmap(teams_csv)
+    if mmap_ids is not None:
+        if not mmap_ids:
+            raise ValueError("No team_id values found in teams CSV.")
+        return mmap_ids
+    # Known fixed schema from the teams script: resolve the column index
+    # once and read tuple rows, skipping DictReader's per-row dict build.
     team_ids: List[int] = []
     with teams_csv.open(newline="", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
+        reader = csv.reader(f)
+        header = next(reader, None)
         # Accept common header variants
-        header_lower = {h.lower(): h for h in reader.fieldnames or []}
-        team_id_key = header_lower.get("team_id")
-        if not team_id_key:
+        header_lower = [h.lower() for h in header or []]
+        if "team_id" not in header_lower:
             raise KeyError("Expected 'team_id' column in teams CSV.")
+        idx = header_lower.index("team_id")
         for row in reader:
-            raw = row.get(team_id_key, "").strip()
+            raw = row[idx].strip() if idx < len(row) else ""
             if raw == "":
                 continue
             try:
@@ -63,23 +172,28 @@ def read_team_ids(teams_csv: Path) -> List[int]:
 
 
 def generate_unique_names(fake: Faker, count: int) -> List[str]:
-    names = set()
-    attempts = 0
-    # cap to avoid infinite loops if count is too large
-    cap = max(5000, count * 3)
-    while len(names) < count and attempts < cap:
-        # American-sounding names via en_US locale
-        name = fake.name()
-        names.add(name)
-        attempts += 1
+    # Overdraw ~20% in one bulk pass, dedupe preserving order, then top up
+    # with indexed variants. No retry loop, so the cost stays linear even
+    # when the requested count approaches Faker's name pool size.
+    name = fake.name  # bound-method hoist for the bulk draw
+    overdraw = count + count // 5 + 1
+    # American-sounding names via en_US locale
+    names = list(dict.fromkeys(name() for _ in range(overdraw)))[:count]
     if len(names) < count:
-        # Fill remainder  using indexed variants
-        base_list = list(names) or [fake.first_name() + " " + fake.last_name()]
+        # Fill remainder using indexed variants
+        base_list = list(names)
         i = 0
         while len(names) < count:
-            names.add(f"{base_list[i % len(base_list)]} {i//len(base_list)+2}")
+            names.append(f"{base_list[i % len(base_list)]} {i//len(base_list)+2}")
             i += 1
-    return list(names)
+    return names
+
+
+def _generate_players_chunk(job: tuple) -> dict:
+    """Pool worker: generate one slab of teams with its own Faker/seed."""
+    team_chunk, players_per_team, age_min, age_max, start_id, seed = job
+    return generate_players(team_chunk, players_per_team, age_min, age_max,
+                            start_id, seed)
 
 
 def generate_players(
@@ -89,18 +203,46 @@ def generate_players(
     age_max: int,
     start_id: int,
     seed: int | None = None,
-) -> List[Tuple[int, str, int, int]]:
+    workers: int = 1,
+) -> dict:
     if age_min > age_max:
         raise ValueError("age-min cannot be greater than age-max")
     if players_per_team < 0:
         raise ValueError("players-per-team must be >= 0")
     if players_per_team == 0:
-        return []
+        return {"player_id": [], "player_name": [], "player_age": [], "player_team_id": []}
 
-    fake = Faker("en_US")
+    if workers > 1 and len(team_ids) > 1:
+        # Teams are independent, so split them into per-worker slabs with
+        # disjoint player_id ranges and derived seeds, then merge columns.
+        workers = min(workers, len(team_ids))
+        chunk_size = -(-len(team_ids) // workers)
+        jobs = []
+        offset = start_id
+        for i in range(0, len(team_ids), chunk_size):
+            chunk = team_ids[i:i + chunk_size]
+            chunk_seed = None if seed is None else seed + i
+            jobs.append((chunk, players_per_team, age_min, age_max, offset, chunk_seed))
+            offset += len(chunk) * players_per_team
+        with multiprocessing.Pool(len(jobs)) as pool:
+            parts = pool.map(_generate_players_chunk, jobs)
+        merged = {col: [v for part in parts for v in part[col]] for col in parts[0]}
+        # Workers dedupe names only within their slab; fix the rare
+        # cross-slab duplicate with the usual indexed variants.
+        seen: set = set()
+        names = merged["player_name"]
+        for idx, n in enumerate(names):
+            if n in seen:
+                k = 2
+                while f"{n} {k}" in seen:
+                    k += 1
+                names[idx] = f"{n} {k}"
+            seen.add(names[idx])
+        return merged
+
+    fake = get_faker("en_US", seed)
     if seed is not None:
         random.seed(seed)
-        Faker.seed(seed)
 
     total_players = players_per_team * len(team_ids)
 
@@ -108,31 +250,51 @@ def generate_players(
     names = generate_unique_names(fake, total_players)
     random.shuffle(names)
 
-    rows: List[Tuple[int, str, int, int]] = []
-    pid = start_id
-    name_idx = 0
-
-    for tid in team_ids:
-        for _ in range(players_per_team):
-            age = random.randint(age_min, age_max)
-            rows.append((pid, names[name_idx], age, tid))
-            pid += 1
-            name_idx += 1
+    # Column buffers (SoA): one list per output column instead of a
+    # tuple per row.
+    if np is not None:
+        # One vectorized draw per numeric column instead of a Python call
+        # per player.
+        np_rng = np.random.default_rng(seed)
+        player_ids = np.arange(start_id, start_id + total_players, dtype=np.int64).tolist()
+        player_ages = np_rng.integers(age_min, age_max + 1, size=total_players).tolist()
+        player_team_ids = np.repeat(
+            np.asarray(team_ids, dtype=np.int64), players_per_team).tolist()
+    else:
+        player_ids = list(range(start_id, start_id + total_players))
+        player_ages = [random.randint(age_min, age_max) for _ in range(total_players)]
+        player_team_ids = [tid for tid in team_ids for _ in range(players_per_team)]
 
-    return rows
+    return {
+        "player_id": player_ids,
+        "player_name": names[:total_players],
+        "player_age": player_ages,
+        "player_team_id": player_team_ids,
+    }
 
 
-def write_players_csv(out_csv: Path, rows: List[Tuple[int, str, int, int]]) -> None:
+def write_players_csv(out_csv: Path, columns: dict) -> None:
+    """Write a dict of equal-length column lists, keyed by fieldname."""
     out_csv.parent.mkdir(parents=True, exist_ok=True)
+    if pacsv is not None and any(columns.values()):
+        pacsv.write_csv(pa.table(columns), str(out_csv))
+        return
+    # Fused serialization: format every row into one pre-joined buffer and
+    # issue a single write, skipping csv.writer's per-row/per-cell logic.
+    # Only the name column can need quoting; ids and ages are plain ints.
+    lines = [",".join(columns) + "\n"]
+    append = lines.append
+    for pid, name, age, tid in zip(*columns.values()):
+        if "," in name or '"' in name:
+            name = '"' + name.replace('"', '""') + '"'
+        append(f"{pid},{name},{age},{tid}\n")
     with out_csv.open("w", newline="", encoding="utf-8") as f:
-        writer = csv.writer(f)
-        writer.writerow(["player_id", "player_name", "player_age", "player_team_id"])
-        writer.writerows(rows)
+        f.write("".join(lines))
 
 
 def parse_args(argv: List[str]) -> argparse.Namespace:
     p = argparse.ArgumentParser(description="Generate mock players linked to teams.")
-    p.add_argument("--teams-csv", default="mock_teams.csv", type=Path,
+    p.add_argument("--teams-csv", default="mock_teams.csv", type=existing_csv,
                    help="Path to teams CSV to use for player_team_id values (default: mock_teams.csv).")
     p.add_argument("--players-per-team", default=20, type=int,
                    help="Number of players per team (default: 20).")
@@ -146,22 +308,25 @@ def parse_args(argv: List[str]) -> argparse.Namespace:
                    help="Output CSV path (default: mock_players.csv).")
     p.add_argument("--seed", default=None, type=int,
                    help="Optional RNG seed for reproducibility.")
+    p.add_argument("--workers", default=1, type=int,
+                   help="Process count for generation; >1 splits teams across a pool (default: 1).")
     return p.parse_args(argv)
 
 
 def main(argv: List[str] | None = None) -> int:
     ns = parse_args(argv or sys.argv[1:])
     team_ids = read_team_ids(ns.teams_csv)
-    rows = generate_players(
+    columns = generate_players(
         team_ids=team_ids,
         players_per_team=ns.players_per_team,
         age_min=ns.age_min,
         age_max=ns.age_max,
         start_id=ns.start_id,
         seed=ns.seed,
+        workers=ns.workers,
     )
-    write_players_csv(ns.out, rows)
-    print(f"✔ Generated {len(rows)} players -> {ns.out}")
+    write_players_csv(ns.out, columns)
+    print(f"✔ Generated {len(columns['player_id'])} players -> {ns.out}")
     return 0
 
 
@@ -178,11 +178,13 @@ def generate_unique_mascots(count: int, color_rate: float) -> list[str]:
 
     return out
 
+_APT_RE = re.compile(r"\b(?:Apt|Apartment|Suite|Ste|Unit|#)\b.*$", re.I)
+
 def clean_school_street(fake):
     # Kept for backward-compatibility. used in the standalone venues script
     s = f"{fake.building_number()} {fake.street_name()}"
     s = s.replace("\n", " ")
-    s = re.sub(r"\b(?:Apt|Apartment|Suite|Ste|Unit|#)\b.*$", "", s, flags=re.I)
+    s = _APT_RE.sub("", s)
     return s.strip(" ,")
 
 def generate_teams(num_teams: int, start_id: int, color_rate: float) -> list[dict]:
@@ -25,6 +25,9 @@ Usage:
 import argparse
 import csv
 from dataclasses import dataclass
+import mmap
+import multiprocessing
+import os
 from pathlib import Path
 import random
 import re
@@ -36,6 +39,17 @@ try:
 except ImportError as e:
     sys.exit("Missing dependency: faker. Install with `pip install faker` and retry.")
 
+from mockgen._fake import get_faker
+
+# Optional accelerator: pyarrow tokenizes CSV in C++ with multi-threaded
+# readers. The stdlib csv module is used when it is not installed.
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+except ImportError:
+    pa = None
+    pacsv = None
+
 ROLES = ["Team Admin", "Coach", "Assistant Coach", "Venue Admin", "Event Admin"]
 
 @dataclass
@@ -47,10 +61,19 @@ class Args:
     locale: str
     roles: List[str]
     include_passwords: bool = False
+    workers: int = 1
 
-def parse_args() -> Args:
+def existing_csv(s: str) -> Path:
+    # Validating in the argparse type callback fails fast, before Faker init
+    p = Path(s)
+    if not p.is_file():
+        raise argparse.ArgumentTypeError(f"{s} not found")
+    return p
+
+def parse_args(argv: List[str] | None = None) -> Args:
     p = argparse.ArgumentParser(description="Generate mock users for teams CSV.")
-    p.add_argument("--teams-csv", type=Path, default=Path("mock_teams.csv"),
+    # String default so argparse runs the type callback on it too
+    p.add_argument("--teams-csv", type=existing_csv, default="mock_teams.csv",
                    help="Path to teams CSV from generate_mock_teams.py (must include 'team_id').")
     p.add_argument("--out", type=Path, default=Path("mock_users.csv"),
                    help="Output path for users CSV.")
@@ -64,7 +87,9 @@ def parse_args() -> Args:
                    help="Comma-separated roles to generate. Defaults to all.")
     p.add_argument("--include-passwords", action="store_true",
                    help="Include password hashes in the output")
-    ns = p.parse_args()
+    p.add_argument("--workers", type=int, default=1,
+                   help="Process count for generation; >1 splits teams across a pool. Defaults to 1.")
+    ns = p.parse_args(argv)
     roles = [r.strip() for r in ns.roles.split(",") if r.strip()]
     if not roles:
         roles = ROLES[:]
@@ -75,149 +100,284 @@ def parse_args() -> Args:
         seed=ns.seed,
         locale=ns.locale,
         roles=roles,
-        include_passwords=ns.include_passwords
+        include_passwords=ns.include_passwords,
+        workers=ns.workers,
     )
 
+def _read_team_ids_mmap(path: Path) -> List[str] | None:
+    """Extract team_id from a memory-mapped CSV without the csv module.
+
+    Valid because the teams script never quotes this column; returns None
+    when the file is empty or contains quoted fields.
+    """
+    with path.open("rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return None
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            if mm.find(b'"') != -1:
+                return None
+            header_end = mm.find(b"\n")
+            if header_end == -1:
+                return None
+            headers = [h.strip() for h in
+                       mm[:header_end].decode("utf-8").rstrip("\r").split(",")]
+            if "team_id" not in headers:
+                sys.exit("Required column 'team_id' not found in teams CSV.")
+            idx = headers.index("team_id")
+            team_ids: List[str] = []
+            append = team_ids.append
+            # Walk newline offsets instead of slicing the whole map, which
+            # would copy the file into memory a second time.
+            size = mm.size()
+            pos = header_end + 1
+            while pos < size:
+                nl = mm.find(b"\n", pos)
+                if nl == -1:
+                    nl = size
+                fields = mm[pos:nl].rstrip(b"\r").split(b",")
+                pos = nl + 1
+                if idx < len(fields):
+                    v = fields[idx].strip()
+                    if v:
+                        append(v.decode("utf-8"))
+            return team_ids
+        finally:
+            mm.close()
+
 def read_team_ids(path: Path) -> List[str]:
-    if not path.exists():
-        sys.exit(f"Teams CSV not found: {path}")
+    if pacsv is not None:
+        try:
+            table = pacsv.read_csv(path, convert_options=pacsv.ConvertOptions(
+                include_columns=["team_id"], column_types={"team_id": pa.string()}))
+        except (KeyError, pa.ArrowInvalid):
+            # No exact 'team_id' header, or an empty file. The stdlib
+            # paths strip header whitespace before matching and report
+            # a genuinely missing column, so fall through to them.
+            table = None
+        if table is not None:
+            team_ids = [v.strip() for v in table.column("team_id").to_pylist() if v and v.strip()]
+            if not team_ids:
+                sys.exit("No team_id values found in teams CSV.")
+            return team_ids
 
+    team_ids = _read_team_ids_mmap(path)
+    if team_ids is not None:
+        if not team_ids:
+            sys.exit("No team_id values found in teams CSV.")
+        return team_ids
+
+    # Known fixed schema from the teams script: resolve the column index
+    # once and read tuple rows, skipping DictReader's per-row dict build.
     with path.open("r", encoding="utf-8", newline="") as f:
-        reader = csv.DictReader(f)
-        if reader.fieldnames is None:
+        reader = csv.reader(f)
+        header = next(reader, None)
+        if header is None:
             sys.exit("Teams CSV has no header row.")
-        headers = [h.strip() for h in reader.fieldnames]
+        headers = [h.strip() for h in header]
         if "team_id" not in headers:
             sys.exit("Required column 'team_id' not found in teams CSV.")
+        idx = headers.index("team_id")
         team_ids: List[str] = []
         for row in reader:
-            v = str(row.get("team_id", "")).strip()
-            if v:
-                team_ids.append(v)
+            if idx < len(row):
+                v = row[idx].strip()
+                if v:
+                    team_ids.append(v)
         if not team_ids:
             sys.exit("No team_id values found in teams CSV.")
         return team_ids
 
+# Deletion table built once: strips every ASCII char outside [a-z0-9].
+# en_US Faker names are ASCII, so the regex only runs for other locales.
+_SLUG_TABLE = {c: None for c in range(128) if not chr(c).isalnum()}
+_SLUG_RE = re.compile(r"[^a-z0-9]")
+
 def slugify(s: str) -> str:
-    return re.sub(r"[^a-z0-9]", "", s.lower())
-
-def ensure_unique(generator_fn, seen: Set[str], max_attempts: int = 1000) -> str:
-    for _ in range(max_attempts):
-        val = generator_fn()
-        if val not in seen:
-            seen.add(val)
-            return val
-    base = generator_fn()
-    suffix = 1
-    candidate = base
-    while candidate in seen:
-        candidate = f"{base}{suffix}"
-        suffix += 1
-    seen.add(candidate)
-    return candidate
-
-def build_unique_name(fake: Faker, seen_names: Set[str]) -> str:
+    s = s.lower()
+    if s.isascii():
+        return s.translate(_SLUG_TABLE)
+    return _SLUG_RE.sub("", s)
+
+def bulk_unique_names(fake: Faker, count: int) -> List[str]:
+    # Overdraw ~20% in one bulk pass, dedupe preserving order, then fill
+    # with middle-initial variants and, as a last resort, indexed ones.
     rng = fake.random
-    def gen():
-        first = fake.first_name()
-        last = fake.last_name()
-        name = f"{first} {last}"
-        if name in seen_names:
+    first_name = fake.first_name
+    last_name = fake.last_name
+    overdraw = count + count // 5 + 1
+    names = list(dict.fromkeys(
+        f"{first_name()} {last_name()}" for _ in range(overdraw)))[:count]
+    if len(names) < count:
+        seen = set(names)
+        attempts = 0
+        max_attempts = count * 10 + 100
+        while len(names) < count and attempts < max_attempts:
             mid = rng.choice("ABCDEFGHIJKLMNOPQRSTUVWXYZ")
-            name = f"{first} {mid}. {last}"
-        return name
-    return ensure_unique(gen, seen_names)
+            cand = f"{first_name()} {mid}. {last_name()}"
+            if cand not in seen:
+                seen.add(cand)
+                names.append(cand)
+            attempts += 1
+        base = len(names)
+        i = 0
+        while len(names) < count:
+            names.append(f"{names[i % base]} {i // base + 2}")
+            i += 1
+    return names
+
+def email_domains(fake: Faker) -> tuple:
+    # Built once per run: free_email_domain only ever returns a handful of
+    # distinct values, so paying a Faker call per user for it is wasted.
+    # dict.fromkeys dedupes in draw order; a set here would make the tuple
+    # order (and thus seeded runs) depend on PYTHONHASHSEED.
+    return ("example.com", "example.org", "example.net") + \
+        tuple(dict.fromkeys(fake.free_email_domain() for _ in range(32)))
 
-def build_unique_email(fake: Faker, full_name: str, seen_emails: Set[str]) -> str:
+def bulk_emails(fake: Faker, names: List[str]) -> List[str]:
+    # Single pass over pre-drawn suffix and domain columns; the digit
+    # suffix carries uniqueness, so collisions are rare enough to patch in
+    # one ordered dedupe sweep afterwards.
     rng = fake.random
-    first, *rest = full_name.replace(".", "").split()
-    last = rest[-1] if rest else ""
-    first_slug = slugify(first)
-    last_slug = slugify(last)
-    base_local = f"{first_slug}.{last_slug}" if last_slug else first_slug
-    domains = [
-        "example.com", "example.org", "example.net",
-        fake.free_email_domain(),
-    ]
-    def gen():
-        domain = rng.choice(domains)
-        suffix = str(rng.randint(10, 9999))
+    domains = email_domains(fake)
+    n = len(names)
+    suffixes = rng.choices(range(10, 10000), k=n)
+    domain_picks = rng.choices(domains, k=n)
+    emails: List[str] = []
+    append = emails.append
+    for name, suffix, domain in zip(names, suffixes, domain_picks):
+        first, *rest = name.replace(".", "").split()
+        last = rest[-1] if rest else ""
+        first_slug = slugify(first)
+        last_slug = slugify(last)
+        base_local = f"{first_slug}.{last_slug}" if last_slug else first_slug
         local = f"{base_local}{suffix}" if base_local else fake.user_name()
-        return f"{local}@{domain}"
-    return ensure_unique(gen, seen_emails)
-
-def build_unique_phone(fake: Faker, seen_phones: Set[str]) -> str:
-    def gen():
-        return fake.numerify("(###) ###-####")
-    return ensure_unique(gen, seen_phones)
-
-def generate_users(team_ids: Iterable[str], start_user_id: int, fake: Faker, 
-                   roles: Iterable[str], include_passwords: bool = False) -> List[dict]:
-    users: List[dict] = []
-    seen_names: Set[str] = set()
-    seen_emails: Set[str] = set()
-    seen_phones: Set[str] = set()
+        append(f"{local}@{domain}")
+    seen: Set[str] = set()
+    for i, email in enumerate(emails):
+        if email in seen:
+            local, _, domain = email.partition("@")
+            c = 1
+            cand = f"{local}{c}@{domain}"
+            while cand in seen:
+                c += 1
+                cand = f"{local}{c}@{domain}"
+            emails[i] = cand
+        seen.add(emails[i])
+    return emails
+
+def bulk_phones(rng: random.Random, count: int) -> List[str]:
+    # Distinct by construction: sampling the 10-digit space without
+    # replacement needs no seen-set probe per row. random.sample walks the
+    # range lazily, so the population is never materialized.
+    draws = rng.sample(range(2_000_000_000, 10_000_000_000), k=count)
+    return [f"({d // 10_000_000:03d}) {(d // 10_000) % 1000:03d}-{d % 10_000:04d}"
+            for d in draws]
+
+def _generate_users_chunk(job: tuple) -> dict:
+    """Pool worker: generate one slab of teams with its own Faker/seed."""
+    team_chunk, start_uid, locale, seed, roles, include_passwords = job
+    fake = get_faker(locale, seed)
+    return generate_users(team_chunk, start_uid, fake, roles, include_passwords)
+
+def generate_users_parallel(team_ids: List[str], start_user_id: int, locale: str,
+                            seed: int | None, roles: List[str],
+                            include_passwords: bool, workers: int) -> dict:
+    """Split teams across a multiprocessing pool and merge the columns.
+
+    Each worker owns a disjoint user_id range and a derived seed; the
+    digit-suffixed emails and 10-digit phones make cross-worker collisions
+    negligible there. Names come from Faker's small first/last pool, so
+    cross-slab duplicates do happen and are fixed after the merge.
+    """
+    workers = min(workers, len(team_ids))
+    chunk_size = -(-len(team_ids) // workers)
+    jobs = []
     uid = start_user_id
+    for i in range(0, len(team_ids), chunk_size):
+        chunk = team_ids[i:i + chunk_size]
+        chunk_seed = None if seed is None else seed + i
+        jobs.append((chunk, uid, locale, chunk_seed, roles, include_passwords))
+        uid += len(chunk) * len(roles)
+    with multiprocessing.Pool(len(jobs)) as pool:
+        parts = pool.map(_generate_users_chunk, jobs)
+    merged = {col: [v for part in parts for v in part[col]] for col in parts[0]}
+    # Workers dedupe names only within their slab; fix the rare
+    # cross-slab duplicate with the usual indexed variants.
+    seen: Set[str] = set()
+    names = merged["user_full_name"]
+    for idx, n in enumerate(names):
+        if n in seen:
+            k = 2
+            while f"{n} {k}" in seen:
+                k += 1
+            names[idx] = f"{n} {k}"
+        seen.add(names[idx])
+    return merged
 
-    for team_id in team_ids:
-        for role in roles:
-            full_name = build_unique_name(fake, seen_names)
-            email = build_unique_email(fake, full_name, seen_emails)
-            phone = build_unique_phone(fake, seen_phones)
-            
-            # Generate a simple password based on the username and role
-            username = email.split('@')[0].lower()
-            password = f"{username}123!"  # Simple password for testing
-            
-            user_data = {
-                "user_id": uid,
-                "user_full_name": full_name,
-                "user_email": email,
-                "user_phone": phone,
-                "user_team_id": team_id,
-                "user_role": role,
-            }
-            
-            if include_passwords:
-                user_data["password"] = password
-                user_data["password_hash"] = generate_password_hash(password)
-            
-            users.append(user_data)
-            uid += 1
-    return users
-
-def write_users_csv(path: Path, rows: List[dict], include_passwords: bool = False) -> None:
+def generate_users(team_ids: Iterable[str], start_user_id: int, fake: Faker,
+                   roles: Iterable[str], include_passwords: bool = False) -> dict:
+    # Three bulk column passes (names, emails, phones) plus repeat/tile for
+    # the id columns — no per-row branching or interleaved uniqueness sets.
+    team_ids = list(team_ids)
+    roles = list(roles)
+    total = len(team_ids) * len(roles)
+
+    full_names = bulk_unique_names(fake, total)
+    emails = bulk_emails(fake, full_names)
+    phones = bulk_phones(fake.random, total)
+
+    columns = {
+        "user_id": list(range(start_user_id, start_user_id + total)),
+        "user_full_name": full_names,
+        "user_email": emails,
+        "user_phone": phones,
+        "user_team_id": [tid for tid in team_ids for _ in roles],
+        "user_role": roles * len(team_ids),
+    }
+    if include_passwords:
+        # Simple passwords based on the username, for testing only
+        passwords = [f"{email.split('@')[0].lower()}123!" for email in emails]
+        columns["password"] = passwords
+        columns["password_hash"] = [generate_password_hash(pw) for pw in passwords]
+    return columns
+
+def write_users_csv(path: Path, columns: dict) -> None:
+    """Write a dict of equal-length column lists, keyed by fieldname."""
     path.parent.mkdir(parents=True, exist_ok=True)
-    fields = ["user_id", "user_full_name", "user_email", "user_phone", "user_team_id", "user_role"]
-    
-    if include_passwords and rows and any("password" in row for row in rows):
-        fields.extend(["password", "password_hash"])
-    
+
+    if pacsv is not None and any(columns.values()):
+        pacsv.write_csv(pa.table(columns), str(path))
+        return
+
     with path.open("w", encoding="utf-8", newline="") as f:
-        w = csv.DictWriter(f, fieldnames=fields, extrasaction='ignore')
-        w.writeheader()
-        w.writerows(rows)
+        w = csv.writer(f)
+        w.writerow(list(columns))
+        w.writerows(zip(*columns.values()))
 
 def generate_password_hash(password: str) -> str:
     """Generate a bcrypt hash for the given password."""
     try:
-        from flask_bcrypt import Bcrypt
-        bcrypt = Bcrypt()
-        return bcrypt.generate_password_hash(password).decode('utf-8')
+        import bcrypt
+        return bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt()).decode('utf-8')
     except ImportError:
-        print("Warning: flask-bcrypt not found. Using a dummy hash.\n"
-              "Install it with: pip install flask-bcrypt bcrypt")
+        print("Warning: bcrypt not found. Using a dummy hash.\n"
+              "Install it with: pip install bcrypt")
         return f"$bcrypt-sha256$v=2,t=2b,r=12${'A'*22}${'B'*31}"  # Dummy hash format
 
-def main() -> int:
-    args = parse_args()
-    fake = Faker(args.locale)
-    if args.seed is not None:
-        fake.seed_instance(args.seed)
+def main(argv: List[str] | None = None) -> int:
+    args = parse_args(argv)
     team_ids = read_team_ids(args.teams_csv)
-    users = generate_users(team_ids, args.start_user_id, fake, args.roles, args.include_passwords)
-    write_users_csv(args.out, users, args.include_passwords)
-    print(f"Wrote {len(users)} users to {args.out}")
+    if args.workers > 1 and len(team_ids) > 1:
+        users = generate_users_parallel(team_ids, args.start_user_id, args.locale,
+                                        args.seed, args.roles, args.include_passwords,
+                                        args.workers)
+    else:
+        fake = get_faker(args.locale, args.seed)
+        users = generate_users(team_ids, args.start_user_id, fake, args.roles,
+                               args.include_passwords)
+    write_users_csv(args.out, users)
+    print(f"Wrote {len(users['user_id'])} users to {args.out}")
     return 0
 
 if __name__ == "__main__":
@@ -1,35 +1,94 @@
 #!/usr/bin/env python3
-import argparse, csv, re, sys
+import argparse, csv, mmap, os, re, sys
 from pathlib import Path
 try:
     from faker import Faker
 except ImportError:
     sys.exit("Missing dependency: Faker. Install with `pip install Faker` and retry.")
 
+from mockgen._fake import get_faker
+
+# Compiled once; re.sub with a string pattern re-parses per call
+_APT_RE = re.compile(r"\b(?:Apt|Apartment|Suite|Ste|Unit|#)\b.*$", re.I)
+_APT_MARKERS = ("apt", "suite", "ste", "unit", "#")
+
 def clean_school_street(fake):
     s = f"{fake.building_number()} {fake.street_name()}"
     s = s.replace("\n", " ")
-    s = re.sub(r"\b(?:Apt|Apartment|Suite|Ste|Unit|#)\b.*$", "", s, flags=re.I)
+    # Cheap substring check first; most streets have no unit suffix at all
+    low = s.lower()
+    if any(m in low for m in _APT_MARKERS):
+        s = _APT_RE.sub("", s)
     return s.strip(" ,")
 
+def existing_csv(s: str) -> Path:
+    # Validating in the argparse type callback fails fast, before Faker init
+    p = Path(s)
+    if not p.is_file():
+        raise argparse.ArgumentTypeError(f"{s} not found")
+    return p
+
+def _read_teams_mmap(path: Path):
+    # mmap fast path: the teams script never quotes these columns, so plain
+    # byte splits beat the csv machinery. Returns None when the file is
+    # empty or contains quoted fields.
+    with path.open("rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return None
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            if mm.find(b'"') != -1:
+                return None
+            header_end = mm.find(b"\n")
+            if header_end == -1:
+                return None
+            headers = mm[:header_end].decode("utf-8").rstrip("\r").split(",")
+            if "team_id" not in headers or "team_school" not in headers:
+                sys.exit("Teams CSV must contain 'team_id' and 'team_school'.")
+            id_idx = headers.index("team_id")
+            school_idx = headers.index("team_school")
+            teams = []
+            append = teams.append
+            # Walk newline offsets instead of slicing the whole map, which
+            # would copy the file into memory a second time.
+            size = mm.size()
+            pos = header_end + 1
+            while pos < size:
+                nl = mm.find(b"\n", pos)
+                if nl == -1:
+                    nl = size
+                fields = mm[pos:nl].rstrip(b"\r").split(b",")
+                pos = nl + 1
+                if max(id_idx, school_idx) < len(fields) and fields[id_idx]:
+                    append({"team_id": fields[id_idx].decode("utf-8"),
+                            "team_school": fields[school_idx].decode("utf-8")})
+            return teams
+        finally:
+            mm.close()
+
 def read_teams(path: Path):
-    if not path.exists():
-        sys.exit(f"Teams CSV not found: {path}")
+    teams = _read_teams_mmap(path)
+    if teams is not None:
+        return teams
     with path.open("r", encoding="utf-8", newline="") as f:
-        rdr = csv.DictReader(f)
-        if not rdr.fieldnames or "team_id" not in rdr.fieldnames or "team_school" not in rdr.fieldnames:
+        rdr = csv.reader(f)
+        header = next(rdr, None)
+        if not header or "team_id" not in header or "team_school" not in header:
             sys.exit("Teams CSV must contain 'team_id' and 'team_school'.")
-        return [{"team_id": r["team_id"], "team_school": r["team_school"]} for r in rdr if r.get("team_id")]
+        id_idx = header.index("team_id")
+        school_idx = header.index("team_school")
+        return [{"team_id": r[id_idx], "team_school": r[school_idx]}
+                for r in rdr if max(id_idx, school_idx) < len(r) and r[id_idx]]
 
-def main():
+def main(argv: list[str] | None = None):
     p = argparse.ArgumentParser(description="Generate venues for teams CSV.")
-    p.add_argument("--teams-csv", type=Path, default=Path("mock_teams.csv"))
+    p.add_argument("--teams-csv", type=existing_csv, default="mock_teams.csv")
     p.add_argument("--out", type=Path, default=Path("mock_venues.csv"))
     p.add_argument("--start-id", type=int, default=3001)
-    args = p.parse_args()
+    args = p.parse_args(argv)
 
     teams = read_teams(args.teams_csv)
-    fake = Faker("en_US")
+    fake = get_faker("en_US")
     rows = []
     for i, t in enumerate(teams):
         vid = args.start_id + i
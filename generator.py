@@ -2,11 +2,12 @@
 
 # Simple GUI to run teams/venues/users/events generators.
 
+import collections
+import concurrent.futures
 import os
 import sys
 import re
 import threading
-import queue
 from pathlib import Path
 import importlib.util
 import subprocess
@@ -21,6 +22,8 @@ except Exception:
 
 HERE = Path(__file__).resolve().parent
 ROLES = ["Team Admin", "Coach", "Assistant Coach", "Venue Admin", "Event Admin","Other"]
+# (row, col) grid slots for the role checkboxes, three per row
+_ROLE_GRID = [(3 + i // 3, i % 3) for i in range(len(ROLES))]
 
 def _try_import_module(mod_name: str, file_name: str):
     p = HERE / file_name
@@ -33,106 +36,237 @@ def _try_import_module(mod_name: str, file_name: str):
     try:
         spec.loader.exec_module(mod)  # type: ignore[attr-defined]
         return mod
-    except Exception:
+    except (Exception, SystemExit):
+        # The generators sys.exit() at import time on missing dependencies
         return None
 
-def _preferred_callable(mod, names):
-    for n in names:
-        fn = getattr(mod, n, None)
-        if callable(fn):
-            return fn
-    return None
-
-def _run_stream(cmd, on_line):
+# In-process fast path: calling a generator's main(argv) directly skips
+# interpreter startup (~100-300 ms per run) and all pipe IPC. Modules are
+# imported once and memoized; anything unimportable (e.g. a missing
+# dependency) falls back to the subprocess path below.
+_GENERATOR_MODULES: dict = {}
+
+def _inproc_main(mod_name: str, file_name: str):
+    """Return the memoized main(argv) of a generator, or None."""
+    if mod_name not in _GENERATOR_MODULES:
+        _GENERATOR_MODULES[mod_name] = _try_import_module(mod_name, file_name)
+    mod = _GENERATOR_MODULES[mod_name]
+    fn = getattr(mod, "main", None) if mod else None
+    return fn if callable(fn) else None
+
+class _LineWriter:
+    """File-like stdout proxy that forwards complete lines to a callback."""
+
+    def __init__(self, on_line):
+        self._on_line = on_line
+        self._buf = ""
+
+    def write(self, s: str) -> int:
+        self._buf += s
+        if "\n" in self._buf:
+            *lines, self._buf = self._buf.split("\n")
+            for line in lines:
+                self._on_line(line)
+        return len(s)
+
+    def flush(self):
+        if self._buf:
+            self._on_line(self._buf)
+            self._buf = ""
+
+class _StreamRouter:
+    """Per-thread stdout routing for concurrent in-process generators.
+
+    redirect_stdout swaps the process-global sys.stdout, so two generators
+    running on the stage pool would capture each other's prints. The router
+    installs itself once and dispatches each write to the _LineWriter
+    registered for the calling thread; unregistered threads (e.g. the Tk
+    thread) keep writing to the original stream.
+    """
+
+    def __init__(self, name: str):
+        self._name = name
+        self._writers = {}
+        self._lock = threading.Lock()
+        self._original = None
+
+    def register(self, writer):
+        with self._lock:
+            if not self._writers:
+                self._original = getattr(sys, self._name)
+                setattr(sys, self._name, self)
+            self._writers[threading.get_ident()] = writer
+
+    def unregister(self):
+        with self._lock:
+            self._writers.pop(threading.get_ident(), None)
+            if not self._writers and self._original is not None:
+                setattr(sys, self._name, self._original)
+                self._original = None
+
+    def write(self, s: str) -> int:
+        w = self._writers.get(threading.get_ident())
+        if w is not None:
+            return w.write(s)
+        return self._original.write(s) if self._original is not None else 0
+
+    def flush(self):
+        w = self._writers.get(threading.get_ident())
+        if w is not None:
+            w.flush()
+        elif self._original is not None:
+            self._original.flush()
+
+_STDOUT_ROUTER = _StreamRouter("stdout")
+_STDERR_ROUTER = _StreamRouter("stderr")
+
+def _run_inproc(fn, argv, on_line) -> int:
+    out = _LineWriter(on_line)
+    # stderr is captured too — argparse's parser.error prints usage there
+    # before raising SystemExit(2) — tagged like the subprocess path.
+    err = _LineWriter(lambda s: on_line(f"[stderr] {s}"))
+    _STDOUT_ROUTER.register(out)
+    _STDERR_ROUTER.register(err)
+    try:
+        rc = fn(argv) or 0
+    except SystemExit as e:
+        # The generators sys.exit(str) on bad input; surface the message
+        if isinstance(e.code, str):
+            on_line(e.code)
+            rc = 1
+        else:
+            rc = e.code or 0
+    except Exception as e:
+        on_line(f"ERROR: {e}")
+        rc = 1
+    finally:
+        _STDOUT_ROUTER.unregister()
+        _STDERR_ROUTER.unregister()
+    out.flush()
+    err.flush()
+    return rc
+
+def _pump_lines(fd, on_line):
+    # Unbuffered pipe pumped with 64 KiB os.read calls: a burst of
+    # thousands of lines costs one syscall, not one readline per line.
+    buf = bytearray()
+    while True:
+        data = os.read(fd, 1 << 16)
+        if not data:
+            break
+        buf += data
+        if b"\n" not in data:
+            continue
+        lines = buf.split(b"\n")
+        buf = bytearray(lines.pop())
+        for raw in lines:
+            on_line(raw.rstrip(b"\r").decode("utf-8", "replace"))
+    if buf:
+        on_line(bytes(buf).rstrip(b"\r").decode("utf-8", "replace"))
+
+def _run_stream(cmd, on_line, env=None):
+    # stdout and stderr get their own pipes and pump loops: merging them
+    # with stderr=STDOUT funnels chatty warnings through the stdout pipe
+    # and loses which stream a line came from.
     proc = subprocess.Popen(
-        cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True, bufsize=1
+        cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, bufsize=0,
+        env=env, close_fds=True
     )
-    for line in proc.stdout:  # type: ignore[union-attr]
-        on_line(line.rstrip("\n"))
+    err_thread = threading.Thread(
+        target=_pump_lines,
+        args=(proc.stderr.fileno(), lambda s: on_line(f"[stderr] {s}")),  # type: ignore[union-attr]
+        daemon=True,
+    )
+    err_thread.start()
+    _pump_lines(proc.stdout.fileno(), on_line)  # type: ignore[union-attr]
+    err_thread.join()
     return proc.wait()
 
+# All humanize rules fold into one alternation with named groups: every
+# line costs exactly one anchored automaton probe, and the match groups
+# say which message table to format from. Ordinary lines fail the probe
+# at the first character.
+_START_MSGS = {
+    "teams": "▶ Starting mock team generation…",
+    "venues": "▶ Starting mock venue generation…",
+    "users": "▶ Starting mock user generation…",
+    "events": "▶ Starting mock event generation…",
+    "players": "▶ Starting mock player generation…",
+}
+_WROTE_FMTS = {
+    "teams": "✔ Successfully generated {n} mock teams. Saved to {path}",
+    "venues": "✔ Successfully generated {n} mock venues. Saved to {path}",
+    "users": "✔ Successfully generated {n} mock users. Saved to {path}",
+    "events": "✔ Successfully generated {n} mock events. Saved to {path}",
+    "event-team rows": "Linked {n} teams to events. Join table saved to {path}",
+    "players": "✔ Successfully generated {n} mock players. Saved to {path}",
+}
+_HUMANIZE_RE = re.compile(
+    r"^(?:\[(?P<start>teams|venues|users|events|players)\] starting…"
+    r"|Wrote (?P<n>\d+) (?P<kind>teams|venues|users|events|players|event-team rows) to (?P<path>.+))$"
+)
+_ERROR_RE = re.compile(r"\berror\b", re.IGNORECASE)
+
 def _humanize_log_line(line: str) -> str:
     s = line
-    # Step starts
-    s = re.sub(r"^\[teams] starting…$", "▶ Starting mock team generation…", s)
-    s = re.sub(r"^\[venues] starting…$", "▶ Starting mock venue generation…", s)
-    s = re.sub(r"^\[users] starting…$", "▶ Starting mock user generation…", s)
-    s = re.sub(r"^\[events] starting…$", "▶ Starting mock event generation…", s)
-    s = re.sub(r"^\[players] starting…$", "▶ Starting mock player generation…", s)
-    # Generator summaries
-    s = re.sub(r"^Wrote (\d+) teams to (.+)$", r"✔ Successfully generated \1 mock teams. Saved to \2", s)
-    s = re.sub(r"^Wrote (\d+) venues to (.+)$", r"✔ Successfully generated \1 mock venues. Saved to \2", s)
-    s = re.sub(r"^Wrote (\d+) users to (.+)$", r"✔ Successfully generated \1 mock users. Saved to \2", s)
-    s = re.sub(r"^Wrote (\d+) events to (.+)$", r"✔ Successfully generated \1 mock events. Saved to \2", s)
-    s = re.sub(r"^Wrote (\d+) event-team rows to (.+)$", r"Linked \1 teams to events. Join table saved to \2", s)
-    s = re.sub(r"^Wrote (\d+) players to (.+)$", r"✔ Successfully generated \1 mock players. Saved to \2", s)
-    if re.search(r"\berror\b", s, flags=re.I):
+    m = _HUMANIZE_RE.match(s)
+    if m:
+        start = m.group("start")
+        if start is not None:
+            return _START_MSGS[start]
+        s = _WROTE_FMTS[m.group("kind")].format(n=m.group("n"), path=m.group("path"))
+    if _ERROR_RE.search(s):
         s = f"❌ {s}"
     return s
 
-# runners 
-def run_teams(teams_count: int, output_dir: str, on_line):
-    script = HERE / "generate_mock_teams.py"
+# runners
+def _run_generator(mod_name: str, file_name: str, argv: list[str], on_line, tag: str):
+    """Run a generator in-process when importable, else via subprocess."""
+    script = HERE / file_name
     if not script.exists():
-        on_line("[teams] ERROR: generate_mock_teams.py not found")
+        on_line(f"[{tag}] ERROR: {file_name} not found")
         return 1
-
-    teams_out = str(Path(output_dir) / "mock_teams.csv")
-    cmd = [
-        sys.executable, str(script),
+    fn = _inproc_main(mod_name, file_name)
+    if fn is not None:
+        return _run_inproc(fn, argv, on_line)
+    # -B skips .pyc writes, -u unbuffers stdout so lines stream as they
+    # are printed. Isolated mode (-I) is deliberately not used: it drops
+    # the script's directory from sys.path and the generators import the
+    # sibling mockgen package. The env vars cover any grandchild
+    # interpreters (e.g. multiprocessing workers).
+    env = {**os.environ, "PYTHONDONTWRITEBYTECODE": "1", "PYTHONUNBUFFERED": "1"}
+    return _run_stream([sys.executable, "-B", "-u", str(script), *argv],
+                       on_line, env=env)
+
+# Runners take the CSV paths as ready-made strings; _on_run resolves the
+# output directory once and derives every path from it in one place.
+def run_teams(teams_count: int, teams_out: str, on_line):
+    argv = [
         "--num-teams", str(teams_count),
         "--out", teams_out,
     ]
-    return _run_stream(cmd, on_line)
+    return _run_generator("generate_mock_teams", "generate_mock_teams.py", argv, on_line, "teams")
 
-def run_users(output_dir: str, users_count: int | None, roles: list[str], include_passwords: bool = False, on_line=None):
-    script = HERE / "generate_mock_users.py"
-    if not script.exists():
-        if on_line: on_line("[users] ERROR: generate_mock_users.py not found")
-        return 1
-    teams_csv = str(Path(output_dir) / "mock_teams.csv")
-    out_csv = str(Path(output_dir) / "mock_users.csv")
+def run_users(teams_csv: str, out_csv: str, users_count: int | None, roles: list[str], include_passwords: bool = False, on_line=None):
     roles_arg = ",".join(roles)
-    cmd = [
-        sys.executable, str(script),
+    argv = [
         "--teams-csv", teams_csv,
         "--out", out_csv,
         "--roles", roles_arg,
     ]
     if include_passwords:
-        cmd.append("--include-passwords")
-    return _run_stream(cmd, on_line or (lambda s: None))
-
-def run_venues(output_dir: str, on_line):
-    script = HERE / "generate_mock_venues.py"
-    if not script.exists():
-        on_line("[venues] ERROR: generate_mock_venues.py not found"); return 1
-    teams_csv = str(Path(output_dir)/"mock_teams.csv")
-    venues_out = str(Path(output_dir)/"mock_venues.csv")
-    cmd=[sys.executable,str(script),"--teams-csv",teams_csv,"--out",venues_out]
-    return _run_stream(cmd,on_line or (lambda s: None))
-
-def run_events(output_dir: str, events_count: int, teams_per_event: int, on_line=None):
-    mod = _try_import_module("generate_mock_events", "generate_mock_events.py")
-    fn = _preferred_callable(mod, ["generate", "main", "run"]) if mod else None
-    if fn:
-        try:
-            if on_line: on_line("[events] callable detected; falling back to CLI to ensure file paths are honored")
-        except Exception:
-            pass  # we’ll use subprocess to guarantee filenames
-
-    script = HERE / "generate_mock_events.py"
-    if not script.exists():
-        if on_line: on_line("[events] ERROR: generate_mock_events.py not found")
-        return 1
-
-    teams_csv = str(Path(output_dir) / "mock_teams.csv")
-    venues_csv = str(Path(output_dir) / "mock_venues.csv")
-    events_out = str(Path(output_dir) / "mock_events.csv")
-    join_out = str(Path(output_dir) / "mock_events-teams.csv")
-
-    cmd = [
-        sys.executable, str(script),
+        argv.append("--include-passwords")
+    return _run_generator("generate_mock_users", "generate_mock_users.py", argv,
+                          on_line or (lambda s: None), "users")
+
+def run_venues(teams_csv: str, venues_out: str, on_line):
+    argv = ["--teams-csv", teams_csv, "--out", venues_out]
+    return _run_generator("generate_mock_venues", "generate_mock_venues.py", argv,
+                          on_line or (lambda s: None), "venues")
+
+def run_events(teams_csv: str, venues_csv: str, events_out: str, join_out: str,
+               events_count: int, teams_per_event: int, on_line=None):
+    argv = [
         "--teams-csv", teams_csv,
         "--venues-csv", venues_csv,
         "--events-out", events_out,
@@ -140,17 +274,11 @@ def run_events(output_dir: str, events_count: int, teams_per_event: int, on_line
         "--num-events", str(events_count),
         "--teams-per-event", str(teams_per_event),
     ]
-    return _run_stream(cmd, on_line or (lambda s: None))
+    return _run_generator("generate_mock_events", "generate_mock_events.py", argv,
+                          on_line or (lambda s: None), "events")
 
-def run_players(output_dir: str, players_per_team: int, age_min: int, age_max: int, on_line=None):
-    script = HERE / "generate_mock_players.py"
-    if not script.exists():
-        if on_line: on_line("[players] ERROR: generate_mock_players.py not found")
-        return 1
-    teams_csv = str(Path(output_dir) / "mock_teams.csv")
-    out_csv = str(Path(output_dir) / "mock_players.csv")
-    cmd = [
-        sys.executable, str(script),
+def run_players(teams_csv: str, out_csv: str, players_per_team: int, age_min: int, age_max: int, on_line=None):
+    argv = [
         "--teams-csv", teams_csv,
         "--out", out_csv,
         "--players-per-team", str(players_per_team),
@@ -158,7 +286,8 @@ def run_players(output_dir: str, players_per_team: int, age_min: int, age_max: i
         "--age-max", str(age_max),
         "--start-id", "7001",
     ]
-    return _run_stream(cmd, on_line or (lambda s: None))
+    return _run_generator("generate_mock_players", "generate_mock_players.py", argv,
+                          on_line or (lambda s: None), "players")
 
 # GUI 
 class App(tk.Tk):
@@ -173,8 +302,8 @@ class App(tk.Tk):
                 0,
                 lambda: messagebox.showwarning(
                     "Password Hashing Unavailable",
-                    "Password hashing is unavailable because 'flask-bcrypt' (and 'bcrypt') is not installed or could not be initialized.\n\n"
-                    "Install: pip install flask-bcrypt bcrypt",
+                    "Password hashing is unavailable because 'bcrypt' is not installed or could not be initialized.\n\n"
+                    "Install: pip install bcrypt",
                 ),
             )
 
@@ -199,8 +328,14 @@ class App(tk.Tk):
 
         self._build_ui()
 
-        self.log_queue = queue.Queue()
-        self.after(50, self._drain_log)
+        # deque append/popleft are atomic in CPython, so the single
+        # producer/single consumer log pipe needs no Queue lock.
+        # Draining is event-driven: the producer fires <<LogReady>> when it
+        # appends to an empty backlog, so an idle window costs zero wakeups
+        # instead of a 20 Hz poll.
+        self.log_queue = collections.deque()
+        self._drain_scheduled = False
+        self.bind("<<LogReady>>", self._drain_log)
 
     # UI build 
     def _build_ui(self):
@@ -236,7 +371,7 @@ class App(tk.Tk):
                 lf_hash,
                 text=(
                     "Password hashing panel is unavailable.\n\n"
-                    "Install dependencies: pip install flask-bcrypt bcrypt"
+                    "Install dependencies: pip install bcrypt"
                 ),
                 justify="left",
             ).pack(anchor="w")
@@ -287,14 +422,15 @@ class App(tk.Tk):
         ttk.Label(uf, text="Select roles to generate:").grid(row=2, column=0, columnspan=3, 
                                                            sticky="w", padx=12, pady=(5, 5))
         
-        # Role checkboxes in 3 columns with even spacing
-        for i, role in enumerate(ROLES):
-            row = 3 + (i // 3)
-            col = i % 3
-            ttk.Checkbutton(uf, text=role, variable=self.role_vars[role], 
-                           command=self._toggle_states).grid(
-                               row=row, column=col, 
-                               sticky="w", padx=12, pady=2)
+        # Role checkboxes in 3 columns with even spacing; positions are
+        # precomputed at module scope and the dotted names hoisted once
+        checkbutton = ttk.Checkbutton
+        role_vars = self.role_vars
+        toggle = self._toggle_states
+        for (row, col), role in zip(_ROLE_GRID, ROLES):
+            checkbutton(uf, text=role, variable=role_vars[role],
+                        command=toggle).grid(row=row, column=col,
+                                             sticky="w", padx=12, pady=2)
 
         # Events
         ef = ttk.LabelFrame(parent, text="Events")
@@ -371,23 +507,35 @@ class App(tk.Tk):
             self.output_dir.set(path)
 
     # logging 
-    def _append_log(self, line: str):
-        """UI-thread writer. Do not call directly; use _enqueue_log."""
+    def _append_log(self, lines: list[str]):
+        """UI-thread batch writer. Do not call directly; use _enqueue_log."""
         self.log.configure(state="normal")
-        self.log.insert("end", line + "\n")
+        self.log.insert("end", "\n".join(lines) + "\n")
         self.log.see("end")
         self.log.configure(state="disabled")
 
     def _enqueue_log(self, line: str):
-        self.log_queue.put(_humanize_log_line(line))
-
-    def _drain_log(self):
-        try:
-            while True:
-                self._append_log(self.log_queue.get_nowait())
-        except queue.Empty:
-            pass
-        self.after(50, self._drain_log)
+        # Raw append only: humanizing here would burn worker-thread time
+        # (and GIL share) per line; the drain amortizes it per batch.
+        self.log_queue.append(line)
+        # One pending wake at a time; lines appended while a drain is
+        # pending ride along with it.
+        if not self._drain_scheduled:
+            self._drain_scheduled = True
+            self.event_generate("<<LogReady>>", when="tail")
+
+    def _drain_log(self, event=None):
+        # Drain the whole backlog, humanize it as one batch, and write it
+        # with one insert: one state toggle, one redraw and one autoscroll
+        # per wake instead of one per line. The flag resets before the
+        # drain so a producer appending mid-drain re-arms the wakeup.
+        self._drain_scheduled = False
+        q = self.log_queue
+        lines = []
+        while q:
+            lines.append(q.popleft())
+        if lines:
+            self._append_log(list(map(_humanize_log_line, lines)))
 
     # actions 
     def _on_run(self):
@@ -398,31 +546,64 @@ class App(tk.Tk):
             messagebox.showerror("Error", f"Cannot create output directory:\n{e}")
             return
 
-        plan = [
-            ("teams", run_teams, dict(teams_count=self.teams_count.get(),
-                                     output_dir=str(outdir)))
-        ]
-        if getattr(self, "run_venues_var", tk.BooleanVar(value=True)).get():
-            plan.append(("venues", run_venues, dict(output_dir=str(outdir))))
-
-        if self.run_users_var.get():
-            selected_roles = [role for role, var in self.role_vars.items() if var.get()]
-            plan.append(("users", run_users, dict(output_dir=str(outdir),
-                                          users_count=self.users_count.get(),
-                                          roles=selected_roles,
-                                          include_passwords=self.include_passwords.get())))
-        if self.run_events_var.get():
-            plan.append(("events", run_events, dict(output_dir=str(outdir),
-                                                    events_count=self.events_count.get(),
-                                                    teams_per_event=self.teams_per_event.get())))
-
-        if self.run_players_var.get():
-            plan.append(("players", run_players, dict(
-                output_dir=str(outdir),
-                players_per_team=self.players_per_team.get(),
-                age_min=self.age_min.get(),
-                age_max=self.age_max.get(),
-            )))
+        # All generator paths derive from outdir; build each string once
+        # here instead of re-parsing Path objects inside every runner.
+        teams_csv = str(outdir / "mock_teams.csv")
+        venues_csv = str(outdir / "mock_venues.csv")
+        users_csv = str(outdir / "mock_users.csv")
+        events_csv = str(outdir / "mock_events.csv")
+        events_join_csv = str(outdir / "mock_events-teams.csv")
+        players_csv = str(outdir / "mock_players.csv")
+
+        # Snapshot every Tk variable once on the UI thread: each .get() is
+        # a Tcl round-trip, and the worker thread must not touch Tk at all.
+        cfg = {
+            "outdir": str(outdir),
+            "teams": self.teams_count.get(),
+            "users": self.users_count.get(),
+            "events": self.events_count.get(),
+            "tpe": self.teams_per_event.get(),
+            "ppt": self.players_per_team.get(),
+            "amin": self.age_min.get(),
+            "amax": self.age_max.get(),
+            "roles": [role for role, var in self.role_vars.items() if var.get()],
+            "pw": self.include_passwords.get(),
+            "run_venues": getattr(self, "run_venues_var", tk.BooleanVar(value=True)).get(),
+            "run_users": self.run_users_var.get(),
+            "run_events": self.run_events_var.get(),
+            "run_players": self.run_players_var.get(),
+        }
+
+        plan = {
+            "teams": (run_teams, dict(teams_count=cfg["teams"],
+                                      teams_out=teams_csv))
+        }
+        if cfg["run_venues"]:
+            plan["venues"] = (run_venues, dict(teams_csv=teams_csv,
+                                               venues_out=venues_csv))
+
+        if cfg["run_users"]:
+            plan["users"] = (run_users, dict(teams_csv=teams_csv,
+                                          out_csv=users_csv,
+                                          users_count=cfg["users"],
+                                          roles=cfg["roles"],
+                                          include_passwords=cfg["pw"]))
+        if cfg["run_events"]:
+            plan["events"] = (run_events, dict(teams_csv=teams_csv,
+                                               venues_csv=venues_csv,
+                                               events_out=events_csv,
+                                               join_out=events_join_csv,
+                                               events_count=cfg["events"],
+                                               teams_per_event=cfg["tpe"]))
+
+        if cfg["run_players"]:
+            plan["players"] = (run_players, dict(
+                teams_csv=teams_csv,
+                out_csv=players_csv,
+                players_per_team=cfg["ppt"],
+                age_min=cfg["amin"],
+                age_max=cfg["amax"],
+            ))
 
         if not plan:
             messagebox.showinfo("Nothing to run", "Select at least one generator.")
@@ -451,7 +632,8 @@ class App(tk.Tk):
                 "players": "┣━━━ Starting mock player generation ━━━┫",
             }
 
-            for name, fn, kwargs in plan:
+            def run_step(name):
+                fn, kwargs = plan[name]
                 self._enqueue_log(start_msg.get(name, f"▶ Starting {friendly_name.get(name, name)}…"))
 
                 def on_line(s): self._enqueue_log(s)
@@ -465,7 +647,20 @@ class App(tk.Tk):
                     self._enqueue_log(f"✔ Finished {friendly_name.get(name, name)}.")
                 else:
                     self._enqueue_log(f"❌ {friendly_name.get(name, name).capitalize()} failed. Exit code {rc}")
-                rc_total |= (rc or 0)
+                return rc or 0
+
+            # Dependency stages: venues and players only need the teams CSV,
+            # users only needs teams, events needs teams and venues. Steps in
+            # the same stage run concurrently; every generator's own log
+            # lines name it, so interleaved output stays attributable.
+            stages = (("teams",), ("venues", "players"), ("users", "events"))
+            with concurrent.futures.ThreadPoolExecutor(max_workers=3) as pool:
+                for stage in stages:
+                    present = [n for n in stage if n in plan]
+                    if not present:
+                        continue
+                    for rc in pool.map(run_step, present):
+                        rc_total |= rc
 
             # Summary block
             ok = (rc_total == 0)
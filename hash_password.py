@@ -1,27 +1,39 @@
 #!/usr/bin/env python3
 
 """
-Simple GUI to generate bcrypt password_hash values using Flask-Bcrypt.
+Simple GUI to generate bcrypt password_hash values.
 """
+import concurrent.futures
 import sys
 import tkinter as tk
 import tkinter.font as tkfont
 from tkinter import ttk, messagebox
 
+# bcrypt is used directly: the Flask-Bcrypt wrapper only re-encoded
+# arguments around bcrypt.hashpw while dragging in Flask's import
+# machinery at startup.
 try:
-    from flask_bcrypt import Bcrypt
+    import bcrypt
 except Exception as e:
-    Bcrypt = None  # type: ignore[assignment]
+    bcrypt = None  # type: ignore[assignment]
     _BCRYPT_IMPORT_ERROR = e
 else:
     _BCRYPT_IMPORT_ERROR = None
 
-if Bcrypt is None:
+# Optional: pyperclip hands the hash straight to the OS clipboard,
+# skipping Tk's clipboard commands and the update() event-loop pump, and
+# the contents survive the window closing. Tk's clipboard is the fallback.
+try:
+    import pyperclip
+except ImportError:
+    pyperclip = None
+
+if bcrypt is None:
     HASHING_AVAILABLE = False
     _BCRYPT_INIT_ERROR = _BCRYPT_IMPORT_ERROR
 else:
     try:
-        _ = Bcrypt()
+        bcrypt.gensalt(4)
     except Exception as e:
         HASHING_AVAILABLE = False
         _BCRYPT_INIT_ERROR = e
@@ -31,28 +43,44 @@ else:
 
 APP_TITLE = "Password Hash Generator"
 
+_ITALIC_FONT = None
+
+def _get_italic_font():
+    """Italic variant of TkDefaultFont, allocated once per process."""
+    global _ITALIC_FONT
+    if _ITALIC_FONT is None:
+        _ITALIC_FONT = tkfont.nametofont("TkDefaultFont").copy()
+        _ITALIC_FONT.configure(slant="italic")
+    return _ITALIC_FONT
+
+def _hash_password(pwd: bytes, rounds: int) -> str:
+    # prefix pinned so the output stays $2b$ regardless of the installed
+    # bcrypt backend's default
+    return bcrypt.hashpw(pwd, bcrypt.gensalt(rounds, prefix=b"2b")).decode("utf-8")
+
 class HashPanel(ttk.Frame):
     def __init__(self, parent):
         super().__init__(parent, padding=12)
 
-        self._bcrypt = None
-        if HASHING_AVAILABLE and Bcrypt is not None:
+        self._bcrypt_error = _BCRYPT_INIT_ERROR
+        # One worker is enough: hashes are serialized anyway, and bcrypt
+        # releases the GIL so it runs in parallel with Tk redraws.
+        self._pool = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+        if HASHING_AVAILABLE:
+            # Throwaway cost-4 hash warms the C extension and its Blowfish
+            # tables while Tk is still realizing widgets, so the first real
+            # Generate click starts hot. Result deliberately ignored.
             try:
-                self._bcrypt = Bcrypt()
-            except Exception as e:
-                self._bcrypt = None
-                self._bcrypt_error = e
-            else:
-                self._bcrypt_error = None
-        else:
-            self._bcrypt_error = _BCRYPT_INIT_ERROR
-
-        if self._bcrypt is None:
+                self._pool.submit(_hash_password, b"warmup__", 4)
+            except Exception:
+                pass
+
+        if not HASHING_AVAILABLE:
             banner = tk.Label(
                 self,
                 text=(
-                    "Password hashing is unavailable because the dependency 'flask-bcrypt' (and 'bcrypt') "
-                    "is not installed or could not be initialized.\n\nInstall: pip install flask-bcrypt bcrypt"
+                    "Password hashing is unavailable because the dependency 'bcrypt' "
+                    "is not installed or could not be initialized.\n\nInstall: pip install bcrypt"
                 ),
                 justify="left",
                 fg="firebrick",
@@ -69,8 +97,14 @@ class HashPanel(ttk.Frame):
         frm_in.columnconfigure(4, weight=1)
 
         ttk.Label(frm_in, text="Cost (rounds)").grid(row=1, column=0, sticky="w", pady=(8, 0))
-        self.spn_rounds = ttk.Spinbox(frm_in, from_=4, to=15, width=6)
-        self.spn_rounds.set(12)
+        # IntVar-backed with key-level validation: the click handler reads
+        # a vetted int instead of re-parsing the Tcl string every press.
+        self.var_rounds = tk.IntVar(value=12)
+        self.spn_rounds = ttk.Spinbox(
+            frm_in, from_=4, to=15, width=6, textvariable=self.var_rounds,
+            validate="key",
+            validatecommand=(self.register(self._validate_rounds), "%P"),
+        )
         self.spn_rounds.grid(row=1, column=1, sticky="w", padx=(8, 0), pady=(8, 0))
 
         self.btn_gen = ttk.Button(frm_in, text="Generate", command=self.generate_hash)
@@ -86,80 +120,112 @@ class HashPanel(ttk.Frame):
         frm_out = ttk.LabelFrame(self, text="password_hash", padding=12)
         frm_out.pack(fill="both", expand=True, pady=(12, 0))
 
-        self.txt_hash = tk.Text(frm_out, height=4, wrap="none")
-        self.txt_hash.pack(fill="both", expand=True)
-        self._set_output_state(disabled=True)
+        # The hash is a fixed single-line string, so a readonly Entry on a
+        # StringVar updates in one var.set() with no state toggling.
+        self.var_hash = tk.StringVar()
+        self.ent_hash = ttk.Entry(frm_out, textvariable=self.var_hash,
+                                  state="readonly", font=("TkFixedFont",))
+        self.ent_hash.pack(fill="x", expand=True)
 
         # Footer
         frm_foot = ttk.Frame(self)
         frm_foot.pack(fill="x", pady=(10, 0))
         ttk.Label(frm_foot, text="Paste this value in the password hash column of the mock Users table.").pack(anchor="w")
 
-        italic = tkfont.nametofont("TkDefaultFont").copy()
-        italic.configure(slant="italic")
-        self.lbl_status = tk.Label(frm_foot, text="", font=italic, fg="gray25")
+        self.lbl_status = tk.Label(frm_foot, text="", font=_get_italic_font(), fg="gray25")
         self.lbl_status.pack(anchor="w", pady=(6, 0))
 
-        if self._bcrypt is None:
+        if not HASHING_AVAILABLE:
             self.btn_gen.configure(state="disabled")
             self.set_status(
-                "Hashing is unavailable (missing dependency: flask-bcrypt). "
-                "Install: pip install flask-bcrypt bcrypt"
+                "Hashing is unavailable (missing dependency: bcrypt). "
+                "Install: pip install bcrypt"
             )
-            self._write_output("(Hashing unavailable)\nInstall: pip install flask-bcrypt bcrypt")
-
-    def _set_output_state(self, disabled: bool):
-        self.txt_hash.config(state=("disabled" if disabled else "normal"))
+            self._write_output("(Hashing unavailable) Install: pip install bcrypt")
 
     def _write_output(self, text: str):
-        self._set_output_state(False)
-        self.txt_hash.delete("1.0", "end")
-        if text:
-            self.txt_hash.insert("1.0", text)
-        self._set_output_state(True)
+        self.var_hash.set(text)
 
     def set_status(self, msg: str):
         self.lbl_status.config(text=msg)
 
+    def _validate_rounds(self, proposed: str) -> bool:
+        # Key-level filter: blank is allowed mid-edit, otherwise only
+        # digits that can still become a 4..15 value.
+        return proposed == "" or (proposed.isdigit() and int(proposed) <= 15)
+
     def generate_hash(self):
-        if self._bcrypt is None:
+        if not HASHING_AVAILABLE:
             messagebox.showerror(
                 APP_TITLE,
-                "Missing dependency: flask-bcrypt (and bcrypt).\n\n"
-                "Install: pip install flask-bcrypt bcrypt",
+                "Missing dependency: bcrypt.\n\n"
+                "Install: pip install bcrypt",
             )
             return
 
-        pwd = self.ent_pwd.get()
+        # Encode once up front: bcrypt operates on bytes, and its 72-byte
+        # input limit applies after UTF-8 encoding, which multibyte
+        # characters can hit well before 72 characters.
+        pwd = self.ent_pwd.get().encode("utf-8")
         try:
-            rounds = int(self.spn_rounds.get())
-        except ValueError:
-            messagebox.showerror(APP_TITLE, "Rounds must be an integer.")
+            rounds = self.var_rounds.get()
+        except tk.TclError:
+            rounds = 0  # blank or partial edit left in the spinbox
+        if not (4 <= rounds <= 15):
+            messagebox.showerror(APP_TITLE, "Rounds must be between 4 and 15.")
             return
 
         if len(pwd) < 8:
             messagebox.showerror(APP_TITLE, "Password must be at least 8 characters.")
             return
-        if not (4 <= rounds <= 15):
-            messagebox.showerror(APP_TITLE, "Rounds must be between 4 and 15.")
+        if len(pwd) > 72:
+            messagebox.showerror(
+                APP_TITLE,
+                "Password exceeds 72 bytes after UTF-8 encoding; "
+                "bcrypt would silently truncate it.",
+            )
             return
 
+        # bcrypt at cost 12+ takes hundreds of ms; run it on the pool and
+        # poll the future via after() so the UI stays live.
+        self.btn_gen.configure(state="disabled")
+        self.set_status("Hashing…")
+        fut = self._pool.submit(_hash_password, pwd, rounds)
+        self.after(50, self._poll, fut)
+
+    def _poll(self, fut):
+        if not fut.done():
+            self.after(50, self._poll, fut)
+            return
         try:
-            h = self._bcrypt.generate_password_hash(pwd, rounds=rounds).decode("utf-8")
+            h = fut.result()
         except Exception as e:
-            messagebox.showerror(APP_TITLE, f"Hashing error: {e}")
+            self._hash_failed(e)
             return
+        self._hash_done(h)
 
+    def _hash_done(self, h: str):
         self._write_output(h)
         self.set_status("")
+        self.btn_gen.configure(state="normal")
+
+    def _hash_failed(self, e: Exception):
+        self.btn_gen.configure(state="normal")
+        self.set_status("")
+        messagebox.showerror(APP_TITLE, f"Hashing error: {e}")
 
     def copy_hash(self):
-        self._set_output_state(False)
-        val = self.txt_hash.get("1.0", "end").strip()
-        self._set_output_state(True)
+        val = self.var_hash.get().strip()
         if not val:
             self.set_status("No hash to copy. Generate first.")
             return
+        if pyperclip is not None:
+            try:
+                pyperclip.copy(val)
+                self.set_status("Hashed password copied to clipboard.")
+                return
+            except Exception:
+                pass  # fall through to the Tk clipboard
         try:
             self.clipboard_clear()
             self.clipboard_append(val)
@@ -170,7 +236,7 @@ class HashPanel(ttk.Frame):
 
     def clear_all(self):
         self.ent_pwd.delete(0, "end")
-        self.spn_rounds.set(12)
+        self.var_rounds.set(12)
         self._write_output("")
         self.set_status("")
 
@@ -187,8 +253,8 @@ class HashApp(tk.Tk):
                 0,
                 lambda: messagebox.showwarning(
                     APP_TITLE,
-                    "Password hashing is unavailable because 'flask-bcrypt' (and 'bcrypt') is not installed.\n\n"
-                    "Install: pip install flask-bcrypt bcrypt",
+                    "Password hashing is unavailable because 'bcrypt' is not installed.\n\n"
+                    "Install: pip install bcrypt",
                 ),
             )
 
@@ -0,0 +1 @@
+"""Shared helpers for the mock data generator scripts."""
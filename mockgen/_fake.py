@@ -0,0 +1,25 @@
+"""Memoized Faker construction shared by the generator scripts.
+
+Each script used to build its own instance, so a pipeline running the
+generators back-to-back in one process paid Faker's provider loading
+once per script. Caching by locale amortizes that init; for a
+single-script invocation the cost is unchanged. Seeding happens on
+every call, not just at construction, so repeated seeded runs in one
+process stay reproducible.
+"""
+
+import functools
+
+from faker import Faker
+
+
+@functools.lru_cache(maxsize=8)
+def _make_faker(locale: str) -> Faker:
+    return Faker(locale, use_weighting=False)
+
+
+def get_faker(locale: str, seed: int | None = None) -> Faker:
+    fake = _make_faker(locale)
+    if seed is not None:
+        fake.seed_instance(seed)
+    return fake